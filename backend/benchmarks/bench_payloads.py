@@ -0,0 +1,138 @@
+"""
+Benchmark peak memory and CPU time for adversarial quote payloads.
+
+Run from backend/:  python benchmarks/bench_payloads.py
+Requires httpx (for FastAPI's TestClient).
+
+TestClient buffers request bodies into a single ASGI message, so the streamed
+scenario drives the app directly with a receive() that yields 16 KiB chunks
+(more_body=True) generated on demand.
+
+Accepted quotes go to a throwaway Maildir, never to the developer's configured
+transport (server loads backend/.env, which may hold a real RESEND_API_KEY).
+"""
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Must be set before importing server: load_dotenv() does not override existing values
+_TMP_DIR = tempfile.mkdtemp(prefix="bench-payloads-")
+os.environ["EMAIL_TRANSPORT"] = "file"
+os.environ["EMAIL_MAILDIR"] = os.path.join(_TMP_DIR, "maildir")
+os.environ["SPAM_QUARANTINE_PATH"] = os.path.join(_TMP_DIR, "quarantine.jsonl")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from server import app  # noqa: E402
+
+BASE_QUOTE = {
+    "name": "Bench User",
+    "email": "bench@example.com",
+    "phone": "5555555555",
+    "event_type": "wedding",
+    "message": "Looking for tables and chairs for 120 guests.",
+    "form_elapsed_ms": 45_000,
+}
+
+
+def _payloads():
+    """Yield (label, body bytes) for each buffered scenario."""
+    yield "normal quote", json.dumps({
+        **BASE_QUOTE,
+        "items": [{"id": f"r-{i}", "name": f"Item {i}", "quantity": 2} for i in range(5)],
+    }).encode()
+    yield "2 MB message", json.dumps({**BASE_QUOTE, "message": "A" * 2_000_000}).encode()
+    yield "100k items", json.dumps({
+        **BASE_QUOTE,
+        "items": [{"name": "x" * 10, "quantity": 1} for _ in range(100_000)],
+    }).encode()
+    yield "51 items (under byte cap)", json.dumps({
+        **BASE_QUOTE,
+        "items": [{"name": "Chair", "quantity": 1} for _ in range(51)],
+    }).encode()
+
+
+CHUNK_BYTES = 16 * 1024
+
+
+def _streamed_chunks(total_bytes: int):
+    """Yield a JSON quote body of ~total_bytes in CHUNK_BYTES pieces, built lazily."""
+    fields = {k: v for k, v in BASE_QUOTE.items() if k != "message"}
+    yield json.dumps(fields)[:-1].encode() + b', "message": "'
+    for _ in range(total_bytes // CHUNK_BYTES):
+        yield b"A" * CHUNK_BYTES
+    yield b'"}'
+
+
+async def _post_streamed(total_bytes: int):
+    """POST /api/quotes without Content-Length; return (status, bytes the app pulled)."""
+    chunks = _streamed_chunks(total_bytes)
+    pending = next(chunks)
+    pulled = 0
+    status = None
+
+    async def receive():
+        nonlocal pending, pulled
+        if pending is None:
+            return {"type": "http.disconnect"}
+        body = pending
+        pending = next(chunks, None)
+        pulled += len(body)
+        return {"type": "http.request", "body": body, "more_body": pending is not None}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/quotes",
+        "raw_path": b"/api/quotes",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    await app(scope, receive, send)
+    return status, pulled
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.process_time()
+    result = fn()
+    cpu_ms = (time.process_time() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, cpu_ms, peak / 1024
+
+
+def main() -> None:
+    client = TestClient(app)
+    print(f"{'scenario':<26} {'status':>6} {'cpu ms':>9} {'peak KiB':>10}")
+    for label, body in _payloads():
+        response, cpu_ms, peak = _measure(
+            lambda: client.post("/api/quotes", content=body, headers={"content-type": "application/json"})
+        )
+        print(f"{label:<26} {response.status_code:>6} {cpu_ms:>9.1f} {peak:>10.0f}")
+
+    (status, pulled), cpu_ms, peak = _measure(lambda: asyncio.run(_post_streamed(2_000_000)))
+    print(f"{'2 MB message (streamed)':<26} {status:>6} {cpu_ms:>9.1f} {peak:>10.0f}   read {pulled // 1024} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark per-request spam scoring overhead.
+
+Run from backend/:  python benchmarks/bench_spam_filter.py [--iterations N]
+Trains a throwaway model on synthetic submissions, then times
+check_submission on a typical message and on a max-length one.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import spam_filter  # noqa: E402
+
+HAM = [
+    "Looking for tables chairs and linens for a wedding reception with 120 guests",
+    "Do you rent tents for a backyard birthday party next month",
+    "Interested in arch and floral decor for a baby shower, what are your rates",
+    "Need a PA system and projector for a corporate event in the afternoon",
+]
+SPAM = [
+    "Boost your SEO ranking today visit http://cheap-seo.example best price guaranteed",
+    "Crypto investment opportunity earn $5000 weekly click www.win.example now",
+    "We build websites cheap, reply for free audit of your google ranking",
+    "Buy followers and likes instantly http://followers.example limited offer",
+]
+
+
+def _synthetic(n: int):
+    rng = random.Random(0)
+    texts, labels = [], []
+    for _ in range(n):
+        label = rng.random() < 0.5
+        base = rng.choice(SPAM if label else HAM)
+        words = base.split()
+        rng.shuffle(words)
+        texts.append(spam_filter.submission_text({"name": "Jane Doe", "message": " ".join(words)}))
+        labels.append(int(label))
+    return texts, labels
+
+
+def _time(fields: dict, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        spam_filter.check_submission(fields, None, 8000)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    texts, labels = _synthetic(2000)
+    start = time.perf_counter()
+    model = spam_filter.train(texts, labels)
+    print(f"train: {len(texts)} rows in {time.perf_counter() - start:.2f}s")
+    spam_filter._model, spam_filter._model_loaded = model, True
+
+    typical = {
+        "name": "Jane Doe",
+        "email": "jane@example.com",
+        "subject": "Wedding rentals",
+        "message": HAM[0] + ". " + HAM[2],
+    }
+    longest = {**typical, "message": " ".join(HAM * 200)[:5000]}
+    for label, fields in (("typical message", typical), ("5000-char message", longest)):
+        print(f"{label:<20} {_time(fields, args.iterations):>8.1f} µs/check")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark messages/sec across email transports against a local SMTP stand-in.
+
+Run from backend/:  python benchmarks/bench_transports.py [--messages N] [--rtt-ms MS]
+The stand-in accepts AUTH PLAIN and discards mail; --rtt-ms adds a delay to
+every server reply to approximate a remote relay.
+"""
+
+import argparse
+import base64
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from email_service import (  # noqa: E402
+    EMAIL_FROM,
+    build_quote_email_html,
+    build_quote_email_plain,
+)
+from email_transport import FileTransport, SMTPTransport  # noqa: E402
+
+
+class _SMTPStandIn(socketserver.StreamRequestHandler):
+    """Minimal SMTP server: enough of RFC 5321 for smtplib with AUTH PLAIN."""
+
+    rtt = 0.0
+
+    def _reply(self, line: str) -> None:
+        if self.rtt:
+            time.sleep(self.rtt)
+        self.wfile.write((line + "\r\n").encode())
+
+    def handle(self) -> None:
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reply("220 localhost ESMTP stand-in")
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            cmd = raw.decode(errors="replace").strip()
+            verb = cmd.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self._reply("250-localhost\r\n250 AUTH PLAIN")
+            elif verb == "HELO":
+                self._reply("250 localhost")
+            elif verb == "AUTH":
+                base64.b64decode(cmd.split(" ")[2])
+                self._reply("235 Authentication successful")
+            elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self._reply("250 OK queued")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _params() -> dict:
+    fields = dict(
+        name="Bench User",
+        email="bench@example.com",
+        phone="5555555555",
+        event_type="wedding",
+        message="Looking for tables and chairs for 120 guests.",
+        items=[{"id": f"r-{i}", "name": f"Item {i}", "quantity": 2} for i in range(5)],
+    )
+    return {
+        "from": EMAIL_FROM,
+        "to": ["owner@example.com"],
+        "reply_to": fields["email"],
+        "subject": "Quote Request — wedding | Aruma Events",
+        "html": build_quote_email_html(**fields),
+        "text": build_quote_email_plain(**fields),
+    }
+
+
+def _run(transport, params: dict, messages: int) -> float:
+    start = time.perf_counter()
+    for _ in range(messages):
+        transport.send(params)
+    elapsed = time.perf_counter() - start
+    transport.close()
+    return messages / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--rtt-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    _SMTPStandIn.rtt = args.rtt_ms / 1000
+    server = _Server(("127.0.0.1", 0), _SMTPStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+
+    params = _params()
+    smtp_kwargs = dict(host=host, port=port, username="bench", password="bench", starttls=False)
+    with tempfile.TemporaryDirectory() as maildir:
+        results = [
+            ("smtp (connect per message)", SMTPTransport(pool_size=0, **smtp_kwargs)),
+            ("smtp (pooled)", SMTPTransport(pool_size=4, **smtp_kwargs)),
+            ("file (maildir)", FileTransport(maildir)),
+        ]
+        print(f"{args.messages} messages, stand-in rtt {args.rtt_ms} ms")
+        for label, transport in results:
+            print(f"{label:<28} {_run(transport, params, args.messages):>10.0f} msg/s")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
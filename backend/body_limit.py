@@ -0,0 +1,87 @@
+"""
+ASGI middleware that caps request body size.
+Oversized requests are rejected with 413 while the body is still streaming,
+so the app never buffers, parses or validates them.
+"""
+
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Default cap for public form submissions (64 KiB is well above any real quote/contact payload)
+DEFAULT_MAX_BODY_BYTES = 64 * 1024
+
+
+class MaxBodySizeMiddleware:
+    """Reject HTTP requests whose body exceeds `max_body_bytes` with 413."""
+
+    def __init__(self, app, max_body_bytes: int = DEFAULT_MAX_BODY_BYTES):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Fast path: trust a declared Content-Length and reject before reading anything
+        for key, value in scope.get("headers", []):
+            if key == b"content-length":
+                try:
+                    declared = int(value)
+                except ValueError:
+                    declared = 0
+                if declared > self.max_body_bytes:
+                    await self._send_413(send)
+                    return
+                break
+
+        received = 0
+        rejected = False
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received, rejected, response_started
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    rejected = True
+                    if not response_started:
+                        response_started = True
+                        await self._send_413(send)
+                    # Tell the app the client went away so it stops reading
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message):
+            nonlocal response_started
+            if rejected:
+                # 413 already sent; drop whatever the app tries to respond with
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not rejected:
+                raise
+
+    async def _send_413(self, send) -> None:
+        """Send a JSON 413 response matching FastAPI's error shape."""
+        logger.info("Rejected request body larger than %d bytes", self.max_body_bytes)
+        body = json.dumps({"detail": "Request body too large"}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,12 +1,15 @@
 """
-Email service for sending quote notifications via Resend.
-When RESEND_API_KEY is not set, emails are skipped (useful for local dev).
+Email service for sending quote notifications.
+Delivery goes through the transport configured at startup (see email_transport);
+when no transport is configured, emails are skipped (useful for local dev).
 """
 
 import os
 import logging
 from typing import Optional
 
+from email_transport import EmailTransport, transport_from_env
+
 logger = logging.getLogger(__name__)
 
 # Business email to receive quote notifications
@@ -15,13 +18,24 @@ QUOTE_RECIPIENT_EMAIL = os.environ.get("QUOTE_RECIPIENT_EMAIL", "arumaeventsserv
 EMAIL_FROM = os.environ.get("EMAIL_FROM", "Aruma Events <onboarding@resend.dev>")
 
 
-def _get_resend_client():
-    """Lazy import to avoid failing if resend not installed."""
-    try:
-        import resend
-        return resend
-    except ImportError:
-        return None
+_transport: Optional[EmailTransport] = None
+_transport_configured = False
+
+
+def configure_transport(transport: Optional[EmailTransport]) -> None:
+    """Set the transport used for all outgoing email (None disables sending)."""
+    global _transport, _transport_configured
+    if _transport is not None and _transport is not transport:
+        _transport.close()
+    _transport = transport
+    _transport_configured = True
+
+
+def get_transport() -> Optional[EmailTransport]:
+    """Return the configured transport, building it from env on first use."""
+    if not _transport_configured:
+        configure_transport(transport_from_env())
+    return _transport
 
 
 def _format_event_type(raw: str) -> str:
@@ -234,17 +248,12 @@ def build_quote_email_plain(
 
 
 def _send_email(to: str, subject: str, html: str, text: str, reply_to: Optional[str] = None) -> bool:
-    """Generic email send via Resend. Returns True on success."""
-    api_key = os.environ.get("RESEND_API_KEY")
-    if not api_key:
-        return False
-
-    resend = _get_resend_client()
-    if not resend:
+    """Generic email send via the configured transport. Returns True on success."""
+    transport = get_transport()
+    if not transport:
         return False
 
     try:
-        resend.api_key = api_key
         params = {
             "from": EMAIL_FROM,
             "to": [to],
@@ -254,10 +263,10 @@ def _send_email(to: str, subject: str, html: str, text: str, reply_to: Optional[
         }
         if reply_to:
             params["reply_to"] = reply_to
-        resend.Emails.send(params)
+        transport.send(params)
         return True
     except Exception as e:
-        logger.exception("Failed to send email: %s", e)
+        logger.exception("Failed to send email via %s: %s", transport.name, e)
         return False
 
 
@@ -324,16 +333,11 @@ def send_contact_notification(
     Send contact form notification to the business email.
     Returns True if sent successfully.
     """
-    if not os.environ.get("RESEND_API_KEY"):
-        logger.info("RESEND_API_KEY not set — skipping contact notification email")
-        return False
-
-    resend = _get_resend_client()
-    if not resend:
+    if not get_transport():
+        logger.info("Email transport not configured — skipping contact notification email")
         return False
 
     try:
-        resend.api_key = os.environ.get("RESEND_API_KEY")
         phone_str = phone or "Not provided"
         phone_unspecified = not phone
         message_display = message.replace("\n", "<br>")
@@ -400,20 +404,21 @@ def send_contact_notification(
 </html>
 """.strip()
         text = f"New Contact Form — Aruma Events\n\nFrom: {name}\nEmail: {email}\nPhone: {phone_str}\nSubject: {subject}\n\nMessage:\n{message}"
-        resend.Emails.send({
-            "from": EMAIL_FROM,
-            "to": [QUOTE_RECIPIENT_EMAIL],
-            "reply_to": email,
-            "subject": f"Contact: {subject}",
-            "html": html,
-            "text": text,
-        })
-        logger.info("Contact notification email sent successfully")
-        return True
     except Exception as e:
-        logger.exception("Failed to send contact notification: %s", e)
+        logger.exception("Failed to build contact notification: %s", e)
         return False
 
+    sent = _send_email(
+        to=QUOTE_RECIPIENT_EMAIL,
+        subject=f"Contact: {subject}",
+        html=html,
+        text=text,
+        reply_to=email,
+    )
+    if sent:
+        logger.info("Contact notification email sent successfully")
+    return sent
+
 
 def send_quote_notification(
     name: str,
@@ -428,21 +433,13 @@ def send_quote_notification(
 ) -> bool:
     """
     Send quote request notification to the business email.
-    Returns True if sent successfully, False otherwise (e.g. no API key).
+    Returns True if sent successfully, False otherwise (e.g. no transport configured).
     """
-    api_key = os.environ.get("RESEND_API_KEY")
-    if not api_key:
-        logger.info("RESEND_API_KEY not set — skipping quote notification email")
-        return False
-
-    resend = _get_resend_client()
-    if not resend:
-        logger.warning("Resend package not installed — skipping quote notification email")
+    if not get_transport():
+        logger.info("Email transport not configured — skipping quote notification email")
         return False
 
     try:
-        resend.api_key = api_key
-
         subject = f"Quote Request — {event_type}"
         if event_date:
             subject += f" on {event_date}"
@@ -470,23 +467,21 @@ def send_quote_notification(
             event_location=event_location,
             items=items,
         )
-
-        params = {
-            "from": EMAIL_FROM,
-            "to": [QUOTE_RECIPIENT_EMAIL],
-            "reply_to": email,  # Business can reply directly to customer
-            "subject": subject,
-            "html": html_body,
-            "text": text_body,
-        }
-
-        resend.Emails.send(params)
-        logger.info("Quote notification email sent successfully")
-        return True
     except Exception as e:
-        logger.exception("Failed to send quote notification email: %s", e)
+        logger.exception("Failed to build quote notification email: %s", e)
         return False
 
+    sent = _send_email(
+        to=QUOTE_RECIPIENT_EMAIL,
+        subject=subject,
+        html=html_body,
+        text=text_body,
+        reply_to=email,  # Business can reply directly to customer
+    )
+    if sent:
+        logger.info("Quote notification email sent successfully")
+    return sent
+
 
 def send_quote_confirmation_to_customer(
     customer_email: str,
@@ -499,7 +494,7 @@ def send_quote_confirmation_to_customer(
     Send a confirmation email to the customer that their quote request was received.
     Returns True if sent successfully, False otherwise.
     """
-    if not os.environ.get("RESEND_API_KEY"):
+    if not get_transport():
         return False
 
     html = build_customer_confirmation_html(
@@ -0,0 +1,233 @@
+"""
+Email transports used by email_service.
+A transport is configured once at startup (see transport_from_env) and every
+send goes through it, so backends can be swapped without touching the
+send_* functions.
+
+- resend: Resend HTTP API (production default)
+- smtp:   persistent SMTP connections, pooled and reused across messages
+- file:   local Maildir sink for development and tests
+"""
+
+import logging
+import mailbox
+import os
+import queue
+import smtplib
+import socket
+import threading
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Errors meaning the connection itself is gone, as opposed to an SMTP error reply
+_CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, socket.timeout)
+# Error replies after which smtplib has already sent RSET; the connection is still usable
+_REPLY_ERRORS = (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused)
+
+
+def _header(value: str) -> str:
+    """Fold user-supplied text onto one line; EmailMessage rejects CR/LF in headers."""
+    return " ".join(str(value).splitlines())
+
+
+def build_mime_message(params: dict) -> EmailMessage:
+    """Build a multipart/alternative MIME message from Resend-style params."""
+    msg = EmailMessage()
+    msg["From"] = _header(params["from"])
+    msg["To"] = _header(", ".join(params["to"]))
+    msg["Subject"] = _header(params["subject"])
+    if params.get("reply_to"):
+        msg["Reply-To"] = _header(params["reply_to"])
+    msg.set_content(params.get("text") or "")
+    if params.get("html"):
+        msg.add_alternative(params["html"], subtype="html")
+    return msg
+
+
+class EmailTransport:
+    """
+    Base class for email transports.
+    `params` uses Resend's shape: from, to (list), subject, html, text, optional reply_to.
+    send() raises on failure; callers handle logging.
+    """
+
+    name = "base"
+
+    def send(self, params: dict) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any held resources (connections, files)."""
+
+
+class ResendTransport(EmailTransport):
+    """Send via the Resend API. The API key is set once, here."""
+
+    name = "resend"
+
+    def __init__(self, api_key: str):
+        import resend
+        resend.api_key = api_key
+        self._resend = resend
+
+    def send(self, params: dict) -> None:
+        self._resend.Emails.send(params)
+
+
+class SMTPTransport(EmailTransport):
+    """
+    SMTP with a pool of persistent, already-authenticated connections.
+    Connections are reused across messages. If a pooled connection turns out to
+    be dropped (e.g. relay idle timeout), the rest of the idle pool is assumed
+    stale too: it is drained and the send retried once on a fresh connection.
+    SMTP error replies (refused recipient, bad data) are not retried.
+    pool_size=0 disables reuse (connect per message).
+    """
+
+    name = "smtp"
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 587,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = True,
+        pool_size: int = 4,
+        timeout: float = 10.0,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[smtplib.SMTP]" = queue.LifoQueue(maxsize=max(pool_size, 1))
+
+    def _connect(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            conn.starttls()
+        if self.username:
+            conn.login(self.username, self.password or "")
+        return conn
+
+    def _acquire(self) -> smtplib.SMTP:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def _release(self, conn: smtplib.SMTP) -> None:
+        if self.pool_size > 0:
+            try:
+                self._idle.put_nowait(conn)
+                return
+            except queue.Full:
+                pass
+        self._discard(conn)
+
+    @staticmethod
+    def _discard(conn: smtplib.SMTP) -> None:
+        try:
+            conn.quit()
+        except Exception:
+            conn.close()
+
+    def _send_on(self, conn: smtplib.SMTP, msg: EmailMessage) -> None:
+        """Send on conn and return it to the pool; on failure, keep or drop it as appropriate."""
+        try:
+            conn.send_message(msg)
+        except _REPLY_ERRORS:
+            self._release(conn)
+            raise
+        except Exception:
+            self._discard(conn)
+            raise
+        self._release(conn)
+
+    def send(self, params: dict) -> None:
+        msg = build_mime_message(params)
+        try:
+            self._send_on(self._acquire(), msg)
+        except _CONNECTION_ERRORS:
+            # Pooled connection went stale; its idle siblings likely have too
+            self.close()
+            self._send_on(self._connect(), msg)
+
+    def close(self) -> None:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+
+class FileTransport(EmailTransport):
+    """Write each message into a local Maildir instead of sending it."""
+
+    name = "file"
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        # mailbox.Maildir only creates subfolders for a missing path; handle pre-existing dirs too
+        for sub in ("tmp", "new", "cur"):
+            os.makedirs(os.path.join(directory, sub), exist_ok=True)
+        self._maildir = mailbox.Maildir(directory, create=False)
+        self._lock = threading.Lock()
+
+    def send(self, params: dict) -> None:
+        msg = build_mime_message(params)
+        with self._lock:
+            self._maildir.add(msg)
+
+
+def transport_from_env() -> Optional[EmailTransport]:
+    """
+    Build the transport selected by EMAIL_TRANSPORT (resend | smtp | file).
+    Defaults to resend when RESEND_API_KEY is set. Returns None when email
+    is not configured, in which case sends are skipped.
+    """
+    kind = os.environ.get("EMAIL_TRANSPORT", "").strip().lower()
+    if not kind:
+        kind = "resend" if os.environ.get("RESEND_API_KEY") else ""
+
+    if kind == "resend":
+        api_key = os.environ.get("RESEND_API_KEY")
+        if not api_key:
+            logger.warning("EMAIL_TRANSPORT=resend but RESEND_API_KEY is not set")
+            return None
+        try:
+            return ResendTransport(api_key)
+        except ImportError:
+            logger.warning("Resend package not installed — emails will NOT be sent")
+            return None
+    if kind == "smtp":
+        host = os.environ.get("SMTP_HOST")
+        if not host:
+            logger.warning("EMAIL_TRANSPORT=smtp but SMTP_HOST is not set")
+            return None
+        if not os.environ.get("EMAIL_FROM"):
+            logger.warning(
+                "EMAIL_TRANSPORT=smtp but EMAIL_FROM is not set — the default Resend test sender "
+                "will likely be rejected by the relay or fail SPF/DMARC. Set EMAIL_FROM to an "
+                "address on a domain your relay is allowed to send for."
+            )
+        return SMTPTransport(
+            host=host,
+            port=int(os.environ.get("SMTP_PORT", "587")),
+            username=os.environ.get("SMTP_USERNAME") or None,
+            password=os.environ.get("SMTP_PASSWORD") or None,
+            starttls=os.environ.get("SMTP_STARTTLS", "true").lower() not in ("0", "false", "no"),
+            pool_size=int(os.environ.get("SMTP_POOL_SIZE", "4")),
+        )
+    if kind == "file":
+        return FileTransport(os.environ.get("EMAIL_MAILDIR", str(Path(__file__).parent / "maildir")))
+    if kind:
+        logger.warning("Unknown EMAIL_TRANSPORT %r — emails will NOT be sent", kind)
+    return None
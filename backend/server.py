@@ -5,7 +5,10 @@ import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr
-from typing import Optional
+from typing import List, Optional
+
+from body_limit import MaxBodySizeMiddleware, DEFAULT_MAX_BODY_BYTES
+from spam_filter import check_submission, get_model, quarantine_submission
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -21,28 +24,50 @@ async def app_root():
     return {"message": "Aruma Events API", "docs": "/docs", "api": "/api"}
 
 
+# Payload limits — everything below is rendered into email HTML, so keep it bounded
+MAX_NAME_LENGTH = 200
+MAX_SUBJECT_LENGTH = 200
+MAX_MESSAGE_LENGTH = 5000
+MAX_QUOTE_ITEMS = 50
+MAX_ITEM_QUANTITY = 1000
+
+# Anti-spam signals sent by the forms; never echoed back or emailed
+SPAM_SIGNAL_FIELDS = {"website", "form_elapsed_ms"}
+
+
 # Models
 class ContactSubmission(BaseModel):
     """Contact form (general inquiry)."""
-    name: str
+    name: str = Field(..., max_length=MAX_NAME_LENGTH)
     email: EmailStr
-    phone: Optional[str] = None
-    subject: str
-    message: str
+    phone: Optional[str] = Field(None, max_length=50)
+    subject: str = Field(..., max_length=MAX_SUBJECT_LENGTH)
+    message: str = Field(..., max_length=MAX_MESSAGE_LENGTH)
+    website: Optional[str] = Field(None, max_length=500)  # honeypot — humans leave it empty
+    form_elapsed_ms: Optional[int] = Field(None, ge=0)
+
+
+class QuoteItem(BaseModel):
+    """Single requested rental/service line in a quote."""
+    id: Optional[str] = Field(None, max_length=100)
+    name: str = Field(..., min_length=1, max_length=MAX_NAME_LENGTH)
+    quantity: int = Field(1, ge=1, le=MAX_ITEM_QUANTITY)
 
 
 class QuoteRequestCreate(BaseModel):
-    name: str
+    name: str = Field(..., max_length=MAX_NAME_LENGTH)
     email: EmailStr
-    phone: str
-    event_type: str
-    event_date: Optional[str] = None
-    guest_count: Optional[int] = None
-    event_location: Optional[str] = Field(None, alias="eventLocation")
-    message: str
-    service_id: Optional[str] = None
-    rental_id: Optional[str] = None
-    items: Optional[list] = None
+    phone: str = Field(..., max_length=50)
+    event_type: str = Field(..., max_length=100)
+    event_date: Optional[str] = Field(None, max_length=50)
+    guest_count: Optional[int] = Field(None, ge=0, le=100000)
+    event_location: Optional[str] = Field(None, alias="eventLocation", max_length=500)
+    message: str = Field(..., max_length=MAX_MESSAGE_LENGTH)
+    service_id: Optional[str] = Field(None, max_length=100)
+    rental_id: Optional[str] = Field(None, max_length=100)
+    items: Optional[List[QuoteItem]] = Field(None, max_length=MAX_QUOTE_ITEMS)
+    website: Optional[str] = Field(None, max_length=500)  # honeypot — humans leave it empty
+    form_elapsed_ms: Optional[int] = Field(None, ge=0)
 
 
 # Root endpoint
@@ -99,6 +124,17 @@ def _send_contact_email_task(name: str, email: str, phone: str, subject: str, me
 # Contact form endpoint
 @api_router.post("/contact")
 async def submit_contact(input: ContactSubmission, background_tasks: BackgroundTasks):
+    success = {
+        "success": True,
+        "message": "Thank you for contacting us! We will get back to you within 24 hours.",
+    }
+    fields = input.model_dump(exclude=SPAM_SIGNAL_FIELDS)
+    verdict = check_submission(fields, input.website, input.form_elapsed_ms)
+    if verdict.is_spam:
+        # Same response as a real submission so bots learn nothing
+        background_tasks.add_task(quarantine_submission, "contact", fields, verdict)
+        return success
+
     background_tasks.add_task(
         _send_contact_email_task,
         input.name,
@@ -107,17 +143,26 @@ async def submit_contact(input: ContactSubmission, background_tasks: BackgroundT
         input.subject,
         input.message,
     )
-    return {
-        "success": True,
-        "message": "Thank you for contacting us! We will get back to you within 24 hours.",
-    }
+    return success
 
 
 # Quote request endpoint
 @api_router.post("/quotes")
 async def submit_quote_request(input: QuoteRequestCreate, background_tasks: BackgroundTasks):
-    data = input.model_dump(by_alias=True)
+    data = input.model_dump(by_alias=True, exclude=SPAM_SIGNAL_FIELDS)
     items = data.pop("items", None)
+    success = {
+        "success": True,
+        "message": "Quote request submitted successfully. We'll get back to you within 24-48 hours.",
+        "data": data,
+    }
+
+    fields = input.model_dump(exclude=SPAM_SIGNAL_FIELDS)
+    verdict = check_submission(fields, input.website, input.form_elapsed_ms)
+    if verdict.is_spam:
+        # Same response as a real submission so bots learn nothing
+        background_tasks.add_task(quarantine_submission, "quote", fields, verdict)
+        return success
 
     background_tasks.add_task(
         _send_quote_emails_task,
@@ -132,16 +177,18 @@ async def submit_quote_request(input: QuoteRequestCreate, background_tasks: Back
         items,
     )
 
-    return {
-        "success": True,
-        "message": "Quote request submitted successfully. We'll get back to you within 24-48 hours.",
-        "data": data,
-    }
+    return success
 
 
 # Include router
 app.include_router(api_router)
 
+# Body size guard — registered before CORS so 413 responses still carry CORS headers
+app.add_middleware(
+    MaxBodySizeMiddleware,
+    max_body_bytes=int(os.environ.get("MAX_REQUEST_BODY_BYTES", DEFAULT_MAX_BODY_BYTES)),
+)
+
 # CORS
 _cors_origins = os.environ.get('CORS_ORIGINS', 'http://localhost:3000,http://localhost:5173,http://127.0.0.1:3000,http://127.0.0.1:5173').split(',')
 app.add_middleware(
@@ -162,11 +209,25 @@ logger = logging.getLogger(__name__)
 
 @app.on_event("startup")
 async def startup_check():
-    if not os.environ.get("RESEND_API_KEY"):
+    from email_service import configure_transport
+    from email_transport import transport_from_env
+
+    transport = transport_from_env()
+    configure_transport(transport)
+    # Load the spam model now rather than inside the first form submission
+    get_model()
+    if transport is None:
         logger.warning(
-            "RESEND_API_KEY not set — quote/contact emails will NOT be sent. "
-            "Add RESEND_API_KEY to .env for email delivery."
+            "No email transport configured — quote/contact emails will NOT be sent. "
+            "Add RESEND_API_KEY (or EMAIL_TRANSPORT=smtp/file) to .env for email delivery."
         )
     else:
         recipient = os.environ.get("QUOTE_RECIPIENT_EMAIL", "arumaeventsservices@gmail.com")
-        logger.info("Quote/contact emails enabled → %s", recipient)
+        logger.info("Quote/contact emails enabled via %s → %s", transport.name, recipient)
+
+
+@app.on_event("shutdown")
+async def shutdown_email_transport():
+    from email_service import configure_transport
+
+    configure_transport(None)
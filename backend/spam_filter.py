@@ -0,0 +1,238 @@
+"""
+Cheap in-process spam scoring for the public contact/quote forms.
+Runs before any email work: a honeypot field, a minimum fill-time check and a
+hashed word n-gram linear classifier (logistic regression scored with NumPy).
+
+The classifier weights are trained offline from labeled exports:
+
+    python spam_filter.py train labeled.jsonl [--out spam_model.npz]
+
+Each line of the export is a submission's fields plus "label" (1 = spam, 0 = ham).
+Without a model file only the honeypot and timing checks run.
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import re
+import threading
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parent
+
+SPAM_MODEL_PATH = os.environ.get("SPAM_MODEL_PATH", str(ROOT_DIR / "spam_model.npz"))
+SPAM_QUARANTINE_PATH = os.environ.get("SPAM_QUARANTINE_PATH", str(ROOT_DIR / "quarantine.jsonl"))
+# Humans need a few seconds to fill either form; bots post instantly
+MIN_FILL_MS = int(os.environ.get("SPAM_MIN_FILL_MS", "3000"))
+
+DEFAULT_BUCKETS = 1 << 18
+DEFAULT_THRESHOLD = 0.9
+# Only the head of long messages is scored, keeping per-request cost bounded
+MAX_SCORED_CHARS = 2000
+# Fields that carry free text worth scoring
+TEXT_FIELDS = ("name", "email", "subject", "event_type", "event_location", "message")
+
+_TOKEN_RE = re.compile(r"[a-z0-9$€£@.:/]+")
+
+
+@dataclass
+class SpamVerdict:
+    """Outcome of check_submission."""
+    is_spam: bool
+    score: float = 0.0
+    reasons: List[str] = field(default_factory=list)
+
+
+def submission_text(fields: dict) -> str:
+    """Join the free-text fields of a submission into one lowercase string."""
+    text = " ".join(str(fields[k]) for k in TEXT_FIELDS if fields.get(k))
+    return text[:MAX_SCORED_CHARS].lower()
+
+
+def hash_features(text: str, n_buckets: int) -> np.ndarray:
+    """Hash word unigrams and bigrams (plus a URL marker) into bucket indices."""
+    tokens = _TOKEN_RE.findall(text)
+    grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    if "http" in text or "www." in text:
+        grams.append("__url__")
+    grams.append("__bias__")
+    return np.fromiter(
+        (zlib.crc32(g.encode()) % n_buckets for g in grams),
+        dtype=np.int64,
+        count=len(grams),
+    )
+
+
+class SpamModel:
+    """Hashed n-gram logistic regression: weights per bucket plus a decision threshold."""
+
+    def __init__(self, weights: np.ndarray, threshold: float = DEFAULT_THRESHOLD):
+        self.weights = weights.astype(np.float32)
+        self.threshold = threshold
+
+    @property
+    def n_buckets(self) -> int:
+        return self.weights.shape[0]
+
+    def score(self, text: str) -> float:
+        """Spam probability in [0, 1]."""
+        z = float(self.weights[hash_features(text, self.n_buckets)].sum())
+        z = max(-50.0, min(50.0, z))
+        return 1.0 / (1.0 + math.exp(-z))
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(path, weights=self.weights, threshold=np.float32(self.threshold))
+
+    @classmethod
+    def load(cls, path: str) -> "SpamModel":
+        with np.load(path) as data:
+            return cls(data["weights"], float(data["threshold"]))
+
+
+def train(
+    texts: List[str],
+    labels: List[int],
+    n_buckets: int = DEFAULT_BUCKETS,
+    epochs: int = 200,
+    learning_rate: float = 0.5,
+    l2: float = 1e-4,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> SpamModel:
+    """Fit weights with full-batch gradient descent on hashed features."""
+    features = [hash_features(t, n_buckets) for t in texts]
+    rows = np.repeat(np.arange(len(features)), [len(f) for f in features])
+    cols = np.concatenate(features)
+    y = np.asarray(labels, dtype=np.float64)
+    w = np.zeros(n_buckets, dtype=np.float64)
+
+    for _ in range(epochs):
+        z = np.bincount(rows, weights=w[cols], minlength=len(y))
+        err = 1.0 / (1.0 + np.exp(-z)) - y
+        grad = np.bincount(cols, weights=err[rows], minlength=n_buckets) / len(y)
+        w -= learning_rate * (grad + l2 * w)
+
+    return SpamModel(w, threshold)
+
+
+_model: Optional[SpamModel] = None
+_model_loaded = False
+_quarantine_lock = threading.Lock()
+
+
+def get_model() -> Optional[SpamModel]:
+    """Load the trained model once; None when no model file exists."""
+    global _model, _model_loaded
+    if not _model_loaded:
+        _model_loaded = True
+        if os.path.exists(SPAM_MODEL_PATH):
+            try:
+                _model = SpamModel.load(SPAM_MODEL_PATH)
+                logger.info("Spam model loaded from %s", SPAM_MODEL_PATH)
+            except Exception as e:
+                logger.exception("Failed to load spam model: %s", e)
+    return _model
+
+
+def check_submission(
+    fields: dict,
+    honeypot: Optional[str] = None,
+    elapsed_ms: Optional[int] = None,
+) -> SpamVerdict:
+    """
+    Score a form submission. Honeypot and timing hits are decisive; otherwise
+    the classifier (if trained) decides. The site's forms always send
+    elapsed_ms, so a missing value means the JSON was posted directly and is
+    treated as suspicious.
+    """
+    if honeypot:
+        return SpamVerdict(True, 1.0, ["honeypot"])
+    if elapsed_ms is None:
+        return SpamVerdict(True, 1.0, ["no_timing"])
+    if elapsed_ms < MIN_FILL_MS:
+        return SpamVerdict(True, 1.0, ["too_fast"])
+
+    model = get_model()
+    if model is None:
+        return SpamVerdict(False)
+    score = model.score(submission_text(fields))
+    if score >= model.threshold:
+        return SpamVerdict(True, score, ["classifier"])
+    return SpamVerdict(False, score)
+
+
+def quarantine_submission(kind: str, fields: dict, verdict: SpamVerdict) -> None:
+    """
+    Append a suspicious submission to the quarantine store (JSON lines).
+    Also logged at WARNING with contact details, so a wrongly flagged lead can be
+    recovered from the logs even if the store is lost (e.g. ephemeral disk).
+    """
+    logger.warning(
+        "Quarantined %s submission (%s): name=%r email=%r phone=%r",
+        kind,
+        ", ".join(verdict.reasons),
+        fields.get("name"),
+        fields.get("email"),
+        fields.get("phone"),
+    )
+    record = {
+        "kind": kind,
+        "received_at": datetime.now(timezone.utc).isoformat(),
+        "score": round(verdict.score, 4),
+        "reasons": verdict.reasons,
+        **fields,
+    }
+    try:
+        with _quarantine_lock, open(SPAM_QUARANTINE_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+    except Exception as e:
+        logger.exception("Failed to quarantine %s submission: %s", kind, e)
+
+
+def _read_labeled(paths: Iterable[str]):
+    texts, labels = [], []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                if "label" not in row:
+                    continue
+                texts.append(submission_text(row))
+                labels.append(int(row["label"]))
+    return texts, labels
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Train the spam classifier from labeled JSONL exports.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    train_cmd = sub.add_parser("train")
+    train_cmd.add_argument("exports", nargs="+", help="JSONL files with submission fields + label (1 spam, 0 ham)")
+    train_cmd.add_argument("--out", default=SPAM_MODEL_PATH)
+    train_cmd.add_argument("--buckets", type=int, default=DEFAULT_BUCKETS)
+    train_cmd.add_argument("--epochs", type=int, default=200)
+    train_cmd.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    texts, labels = _read_labeled(args.exports)
+    if not texts:
+        parser.error("no labeled rows found")
+    model = train(texts, labels, n_buckets=args.buckets, epochs=args.epochs, threshold=args.threshold)
+    predictions = [model.score(t) >= model.threshold for t in texts]
+    accuracy = sum(p == bool(y) for p, y in zip(predictions, labels)) / len(labels)
+    model.save(args.out)
+    print(f"Trained on {len(labels)} rows ({sum(labels)} spam); training accuracy {accuracy:.3f} → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
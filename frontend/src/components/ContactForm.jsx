@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useRef, useState } from 'react';
 import { useForm } from 'react-hook-form';
 import { zodResolver } from '@hookform/resolvers/zod';
 import * as z from 'zod';
@@ -11,18 +11,31 @@ import { Loader2, Send } from 'lucide-react';
 import contactService from '../services/contactService';
 
 const contactFormSchema = z.object({
-  name: z.string().min(2, 'Name must be at least 2 characters'),
+  name: z
+    .string()
+    .min(2, 'Name must be at least 2 characters')
+    .max(200, 'Name must be 200 characters or fewer'),
   email: z.string().email('Please enter a valid email'),
   phone: z
     .string()
+    .max(50, 'Please enter a valid phone number')
     .optional()
     .refine((v) => !v || v.replace(/\D/g, '').length >= 10, 'Please enter a valid phone number'),
-  subject: z.string().min(3, 'Subject must be at least 3 characters'),
-  message: z.string().min(10, 'Message must be at least 10 characters'),
+  subject: z
+    .string()
+    .min(3, 'Subject must be at least 3 characters')
+    .max(200, 'Subject must be 200 characters or fewer'),
+  message: z
+    .string()
+    .min(10, 'Message must be at least 10 characters')
+    .max(5000, 'Message must be 5000 characters or fewer'),
+  website: z.string().optional(),
 });
 
 const ContactForm = () => {
   const [isSubmitting, setIsSubmitting] = useState(false);
+  // When the form was shown — the backend treats near-instant submissions as spam
+  const startedAtRef = useRef(Date.now());
 
   const {
     register,
@@ -37,6 +50,7 @@ const ContactForm = () => {
       phone: '',
       subject: '',
       message: '',
+      website: '',
     },
   });
 
@@ -49,12 +63,15 @@ const ContactForm = () => {
         phone: data.phone?.trim() || undefined,
         subject: data.subject.trim(),
         message: data.message.trim(),
+        website: data.website || undefined,
+        formElapsedMs: Date.now() - startedAtRef.current,
       };
       const result = await contactService.submitContactForm(payload);
       toast.success(result.message || 'Message sent!', {
         description: "We'll get back to you within 24 hours.",
       });
       reset();
+      startedAtRef.current = Date.now();
     } catch (error) {
       toast.error('Something went wrong', {
         description: error.message || 'Please try again.',
@@ -65,7 +82,7 @@ const ContactForm = () => {
   };
 
   return (
-    <form onSubmit={handleSubmit(onSubmit)} className="space-y-5" data-testid="contact-form">
+    <form onSubmit={handleSubmit(onSubmit)} className="relative space-y-5" data-testid="contact-form">
       <div className="grid grid-cols-1 md:grid-cols-2 gap-5">
         <div className="space-y-2">
           <Label htmlFor="contact-name" className="font-body text-sm">
@@ -174,6 +191,12 @@ const ContactForm = () => {
           </>
         )}
       </Button>
+
+      {/* Honeypot — hidden from people, filled in by bots */}
+      <div aria-hidden="true" className="absolute -left-[9999px] h-px w-px overflow-hidden">
+        <label htmlFor="contact-website">Website</label>
+        <input id="contact-website" type="text" tabIndex={-1} autoComplete="off" {...register('website')} />
+      </div>
     </form>
   );
 };
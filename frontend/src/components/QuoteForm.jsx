@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useRef, useState } from 'react';
 import { useForm } from 'react-hook-form';
 import { zodResolver } from '@hookform/resolvers/zod';
 import * as z from 'zod';
@@ -18,14 +18,24 @@ import { Loader2, Send } from 'lucide-react';
 import quoteService from '../services/quoteService';
 
 const formSchema = z.object({
-  name: z.string().min(2, 'Name must be at least 2 characters'),
+  name: z
+    .string()
+    .min(2, 'Name must be at least 2 characters')
+    .max(200, 'Name must be 200 characters or fewer'),
   email: z.string().email('Please enter a valid email'),
-  phone: z.string().min(10, 'Please enter a valid phone number'),
+  phone: z
+    .string()
+    .min(10, 'Please enter a valid phone number')
+    .max(50, 'Please enter a valid phone number'),
   event_type: z.string().min(1, 'Please select an event type'),
   event_date: z.string().optional(),
   guest_count: z.string().optional(),
-  event_location: z.string().optional(),
-  message: z.string().min(10, 'Message must be at least 10 characters'),
+  event_location: z.string().max(500, 'Location must be 500 characters or fewer').optional(),
+  message: z
+    .string()
+    .min(10, 'Message must be at least 10 characters')
+    .max(5000, 'Message must be 5000 characters or fewer'),
+  website: z.string().optional(),
 });
 
 /**
@@ -44,6 +54,8 @@ const QuoteForm = ({
   onSuccess = null,
 }) => {
   const [isSubmitting, setIsSubmitting] = useState(false);
+  // When the form was shown — the backend treats near-instant submissions as spam
+  const startedAtRef = useRef(Date.now());
 
   const {
     register,
@@ -63,6 +75,7 @@ const QuoteForm = ({
       guest_count: '',
       event_location: '',
       message: '',
+      website: '',
     },
   });
 
@@ -98,12 +111,15 @@ const QuoteForm = ({
         items: buildItems(),
         serviceId: serviceId ?? undefined,
         rentalId: rentalId ?? undefined,
+        website: data.website || undefined,
+        formElapsedMs: Date.now() - startedAtRef.current,
       };
       const result = await quoteService.submitQuoteRequest(payload);
       toast.success(result.message || 'Quote request received!', {
         description: "We'll get back to you within 24-48 hours.",
       });
       reset();
+      startedAtRef.current = Date.now();
       if (typeof onSuccess === 'function') onSuccess();
     } catch (error) {
       toast.error('Something went wrong', {
@@ -125,7 +141,7 @@ const QuoteForm = ({
   ];
 
   return (
-    <form onSubmit={handleSubmit(onSubmit)} className="space-y-5" data-testid="quote-form">
+    <form onSubmit={handleSubmit(onSubmit)} className="relative space-y-5" data-testid="quote-form">
       <div className="grid grid-cols-1 md:grid-cols-2 gap-5">
         {/* Name */}
         <div className="space-y-2">
@@ -244,6 +260,9 @@ const QuoteForm = ({
           className="input-focus"
           data-testid="quote-form-event-location"
         />
+        {errors.event_location && (
+          <p className="text-xs text-red-500">{errors.event_location.message}</p>
+        )}
       </div>
 
       {/* Message */}
@@ -281,6 +300,12 @@ const QuoteForm = ({
           </>
         )}
       </Button>
+
+      {/* Honeypot — hidden from people, filled in by bots */}
+      <div aria-hidden="true" className="absolute -left-[9999px] h-px w-px overflow-hidden">
+        <label htmlFor="quote-website">Website</label>
+        <input id="quote-website" type="text" tabIndex={-1} autoComplete="off" {...register('website')} />
+      </div>
     </form>
   );
 };
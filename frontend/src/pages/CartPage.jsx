@@ -2,6 +2,7 @@ import { Link } from 'react-router-dom';
 import { motion, AnimatePresence } from 'framer-motion';
 import { ShoppingBag, Minus, Plus, Trash2 } from 'lucide-react';
 import { useCart } from '../context/CartContext';
+import { MAX_ITEM_QUANTITY } from '../services/cartService';
 import { Button } from '../components/ui/button';
 import { Badge } from '../components/ui/badge';
 import SEO from '../components/SEO';
@@ -148,6 +149,7 @@ const CartPage = () => {
                           size="icon"
                           className="h-8 w-8 rounded-none hover:bg-muted"
                           onClick={() => updateQuantity(item.type, item.id, item.quantity + 1)}
+                          disabled={item.quantity >= MAX_ITEM_QUANTITY}
                           aria-label="Increase quantity"
                           data-testid={`cart-item-increase-${item.type}-${item.id}`}
                         >
@@ -11,6 +11,7 @@ import SEO from '../components/SEO';
 import { getItemById, rentals, inventory } from '../data/staticData';
 import RentalCard from '../components/RentalCard';
 import { useCart } from '../context/CartContext';
+import { MAX_ITEM_QUANTITY } from '../services/cartService';
 
 const RentalDetailPage = () => {
   const { id } = useParams();
@@ -137,11 +138,11 @@ const RentalDetailPage = () => {
                     id="rental-qty"
                     type="number"
                     min={1}
-                    max={999}
+                    max={MAX_ITEM_QUANTITY}
                     value={addQuantity}
                     onChange={(e) => {
                       const v = parseInt(e.target.value, 10);
-                      setAddQuantity(Number.isNaN(v) || v < 1 ? 1 : Math.min(999, v));
+                      setAddQuantity(Number.isNaN(v) || v < 1 ? 1 : Math.min(MAX_ITEM_QUANTITY, v));
                     }}
                     className="w-16 h-11 rounded-full border border-border px-3 text-center font-body text-sm focus:outline-none focus:ring-2 focus:ring-primary"
                     data-testid="rental-detail-quantity"
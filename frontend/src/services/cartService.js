@@ -7,6 +7,9 @@ import storageService, { STORAGE_KEYS } from './storageService';
 
 const CART_KEY = STORAGE_KEYS.CART;
 
+// Per-line quantity cap; the backend rejects quote items above 1000
+export const MAX_ITEM_QUANTITY = 999;
+
 const cartService = {
     /**
      * Get current cart items
@@ -27,16 +30,16 @@ const cartService = {
     },
 
     /**
-     * Add or merge item into cart (same type+id increments quantity)
+     * Add or merge item into cart (same type+id increments quantity, capped at MAX_ITEM_QUANTITY)
      * @param {{ type: 'rental' | 'service', id: string, name: string, quantity?: number, image?: string }} item
      * @returns {Array} Updated cart
      */
     addItem: (item) => {
         const cart = cartService.getCart();
-        const qty = Math.max(1, Number(item.quantity) || 1);
+        const qty = Math.min(MAX_ITEM_QUANTITY, Math.max(1, Number(item.quantity) || 1));
         const existingIndex = cart.findIndex((c) => c.type === item.type && c.id === item.id);
         if (existingIndex >= 0) {
-            cart[existingIndex].quantity += qty;
+            cart[existingIndex].quantity = Math.min(MAX_ITEM_QUANTITY, cart[existingIndex].quantity + qty);
         } else {
             cart.push({
                 type: item.type,
@@ -51,7 +54,7 @@ const cartService = {
     },
 
     /**
-     * Update quantity for a line item (remove if quantity < 1)
+     * Update quantity for a line item (remove if quantity < 1, capped at MAX_ITEM_QUANTITY)
      * @param {string} type - 'rental' | 'service'
      * @param {string} id - Item id
      * @param {number} quantity - New quantity
@@ -59,7 +62,7 @@ const cartService = {
      */
     updateQuantity: (type, id, quantity) => {
         let cart = cartService.getCart();
-        const num = Math.max(0, Number(quantity) | 0);
+        const num = Math.min(MAX_ITEM_QUANTITY, Math.max(0, Number(quantity) | 0));
         if (num < 1) {
             cart = cart.filter((c) => !(c.type === type && c.id === id));
         } else {
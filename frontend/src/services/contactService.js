@@ -51,6 +51,8 @@ const contactService = {
                 phone: contactData.phone ?? undefined,
                 subject: contactData.subject,
                 message: contactData.message,
+                website: contactData.website ?? undefined,
+                form_elapsed_ms: contactData.formElapsedMs ?? undefined,
             };
             return await apiService.postWithRetry(API_ENDPOINTS.CONTACT, payload);
         } catch (error) {
@@ -1,5 +1,6 @@
 import apiService, { API_ENDPOINTS } from './apiService';
 import storageService, { STORAGE_KEYS } from './storageService';
+import { MAX_ITEM_QUANTITY } from './cartService';
 
 /**
  * Quote Service
@@ -68,6 +69,8 @@ const quoteService = {
                 service_id: quoteData.serviceId ?? undefined,
                 rental_id: quoteData.rentalId ?? undefined,
                 items: quoteData.items ?? undefined,
+                website: quoteData.website ?? undefined,
+                form_elapsed_ms: quoteData.formElapsedMs ?? undefined,
             };
             return await apiService.postWithRetry(API_ENDPOINTS.QUOTES, payload);
         } catch (error) {
@@ -127,6 +130,10 @@ const quoteService = {
         // Items validation (optional but recommended)
         if (quoteData.items && !Array.isArray(quoteData.items)) {
             errors.push('Items must be an array');
+        } else if (quoteData.items && quoteData.items.length > 50) {
+            errors.push('A quote can include at most 50 items');
+        } else if (quoteData.items && quoteData.items.some((item) => Number(item.quantity) > MAX_ITEM_QUANTITY)) {
+            errors.push(`Item quantities cannot exceed ${MAX_ITEM_QUANTITY}`);
         }
 
         return {
@@ -0,0 +1,20 @@
+"""
+Shared pytest setup for the backend.
+The backend is a flat set of modules run from backend/, so put that directory
+on sys.path. Email and spam storage are pointed at a temp dir before any
+backend module reads its environment, so tests never send real email.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+_TMP_DIR = tempfile.mkdtemp(prefix="aruma-tests-")
+os.environ["EMAIL_TRANSPORT"] = "file"
+os.environ["EMAIL_MAILDIR"] = os.path.join(_TMP_DIR, "maildir")
+os.environ["SPAM_MODEL_PATH"] = os.path.join(_TMP_DIR, "spam_model.npz")
+os.environ["SPAM_QUARANTINE_PATH"] = os.path.join(_TMP_DIR, "quarantine.jsonl")
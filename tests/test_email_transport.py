@@ -0,0 +1,212 @@
+"""Email transport selection, swapping and the SMTP connection pool."""
+
+import email
+import email.policy
+import mailbox
+import smtplib
+from pathlib import Path
+
+import pytest
+
+import email_service
+import email_transport
+from email_transport import FileTransport, SMTPTransport, transport_from_env
+
+PARAMS = {
+    "from": "Aruma Events <onboarding@resend.dev>",
+    "to": ["owner@example.com"],
+    "reply_to": "jane@example.com",
+    "subject": "Quote Request — wedding | Aruma Events",
+    "html": "<p>Hello <strong>there</strong></p>",
+    "text": "Hello there",
+}
+
+
+class FakeSMTP:
+    """Stands in for smtplib.SMTP; `fail_with` is raised from send_message."""
+
+    def __init__(self, fail_with=None):
+        self.fail_with = fail_with
+        self.sent = 0
+        self.quit_called = False
+
+    def send_message(self, msg):
+        self.sent += 1
+        if self.fail_with:
+            raise self.fail_with
+
+    def quit(self):
+        self.quit_called = True
+        if isinstance(self.fail_with, smtplib.SMTPServerDisconnected):
+            raise smtplib.SMTPServerDisconnected("gone")
+
+    def close(self):
+        pass
+
+
+def _pool(*conns, fresh=None):
+    transport = SMTPTransport(host="smtp.invalid", starttls=False, pool_size=4)
+    for conn in conns:
+        transport._idle.put_nowait(conn)
+    connects = []
+
+    def connect():
+        conn = fresh or FakeSMTP()
+        connects.append(conn)
+        return conn
+
+    transport._connect = connect
+    return transport, connects
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    for key in ("EMAIL_TRANSPORT", "EMAIL_MAILDIR", "RESEND_API_KEY", "SMTP_HOST"):
+        monkeypatch.delenv(key, raising=False)
+    return monkeypatch
+
+
+def test_no_configuration_means_no_transport(clean_env):
+    assert transport_from_env() is None
+
+
+def test_unknown_transport_is_disabled(clean_env):
+    clean_env.setenv("EMAIL_TRANSPORT", "pigeon")
+    assert transport_from_env() is None
+
+
+def test_resend_is_default_when_key_set(clean_env):
+    pytest.importorskip("resend")
+    clean_env.setenv("RESEND_API_KEY", "re_test")
+    assert transport_from_env().name == "resend"
+
+
+def test_smtp_requires_host(clean_env):
+    clean_env.setenv("EMAIL_TRANSPORT", "smtp")
+    assert transport_from_env() is None
+    clean_env.setenv("SMTP_HOST", "smtp.example.com")
+    clean_env.setenv("SMTP_POOL_SIZE", "2")
+    transport = transport_from_env()
+    assert isinstance(transport, SMTPTransport)
+    assert (transport.host, transport.pool_size) == ("smtp.example.com", 2)
+
+
+def test_smtp_without_email_from_warns(clean_env, caplog):
+    clean_env.setenv("EMAIL_TRANSPORT", "smtp")
+    clean_env.setenv("SMTP_HOST", "smtp.example.com")
+    clean_env.delenv("EMAIL_FROM", raising=False)
+    assert isinstance(transport_from_env(), SMTPTransport)
+    assert "EMAIL_FROM is not set" in caplog.text
+
+    caplog.clear()
+    clean_env.setenv("EMAIL_FROM", "Aruma Events <hello@example.com>")
+    transport_from_env()
+    assert "EMAIL_FROM" not in caplog.text
+
+
+def test_file_transport_defaults_to_backend_maildir(clean_env):
+    clean_env.setenv("EMAIL_TRANSPORT", "file")
+    clean_env.setattr(email_transport, "FileTransport", lambda directory: directory)
+    assert transport_from_env() == str(Path(email_transport.__file__).parent / "maildir")
+
+
+def test_file_transport_writes_readable_message(tmp_path):
+    FileTransport(str(tmp_path)).send(PARAMS)
+    maildir = mailbox.Maildir(str(tmp_path), create=False)
+    (key,) = maildir.keys()
+    msg = email.message_from_bytes(maildir.get_bytes(key), policy=email.policy.default)
+    assert msg["Subject"] == PARAMS["subject"]
+    assert msg["Reply-To"] == "jane@example.com"
+    assert "Hello there" in msg.get_body(("plain",)).get_content()
+    assert "<strong>there</strong>" in msg.get_body(("html",)).get_content()
+
+
+def test_newlines_in_headers_are_folded(tmp_path):
+    params = {**PARAMS, "subject": "Contact: Hi\r\nBcc: victim@example.com", "reply_to": "jane@example.com\n"}
+    FileTransport(str(tmp_path)).send(params)
+    maildir = mailbox.Maildir(str(tmp_path), create=False)
+    (key,) = maildir.keys()
+    msg = email.message_from_bytes(maildir.get_bytes(key), policy=email.policy.default)
+    assert msg["Subject"] == "Contact: Hi Bcc: victim@example.com"
+    assert msg["Bcc"] is None
+    assert msg["Reply-To"] == "jane@example.com"
+
+
+def test_configure_transport_swaps_and_closes(monkeypatch):
+    monkeypatch.setattr(email_service, "_transport", None)
+    monkeypatch.setattr(email_service, "_transport_configured", False)
+    first, second = SMTPTransport(host="a"), SMTPTransport(host="b")
+    closed = []
+    first.close = lambda: closed.append("first")
+    second.close = lambda: closed.append("second")
+
+    email_service.configure_transport(first)
+    email_service.configure_transport(second)
+    assert email_service.get_transport() is second
+    assert closed == ["first"]
+    email_service.configure_transport(None)
+    assert email_service.get_transport() is None
+    assert closed == ["first", "second"]
+
+
+def test_send_goes_through_configured_transport(monkeypatch):
+    sent = []
+
+    class Recorder(email_transport.EmailTransport):
+        name = "recorder"
+
+        def send(self, params):
+            sent.append(params)
+
+    monkeypatch.setattr(email_service, "_transport", Recorder())
+    monkeypatch.setattr(email_service, "_transport_configured", True)
+    assert email_service.send_contact_notification(
+        name="Jane", email="jane@example.com", subject="Hi", message="Hello"
+    )
+    assert sent[0]["reply_to"] == "jane@example.com"
+    assert sent[0]["subject"] == "Contact: Hi"
+
+
+def test_pooled_connection_is_reused():
+    conn = FakeSMTP()
+    transport, connects = _pool(conn)
+    transport.send(PARAMS)
+    transport.send(PARAMS)
+    assert conn.sent == 2
+    assert connects == []
+
+
+def test_stale_pool_reconnects_instead_of_reusing_stale_sibling():
+    stale = [FakeSMTP(smtplib.SMTPServerDisconnected("idle timeout")) for _ in range(2)]
+    fresh = FakeSMTP()
+    transport, connects = _pool(*stale, fresh=fresh)
+
+    transport.send(PARAMS)
+
+    assert connects == [fresh]
+    assert fresh.sent == 1
+    # The stale sibling was drained, not tried
+    assert sum(c.sent for c in stale) == 1
+    assert list(transport._idle.queue) == [fresh]
+
+
+def test_reply_error_is_not_retried_and_keeps_connection():
+    refused = smtplib.SMTPRecipientsRefused({"owner@example.com": (550, b"no such user")})
+    conn = FakeSMTP(refused)
+    transport, connects = _pool(conn)
+
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        transport.send(PARAMS)
+
+    assert conn.sent == 1
+    assert connects == []
+    assert list(transport._idle.queue) == [conn]
+
+
+def test_data_error_is_not_retried():
+    conn = FakeSMTP(smtplib.SMTPDataError(554, b"rejected"))
+    transport, connects = _pool(conn)
+    with pytest.raises(smtplib.SMTPDataError):
+        transport.send(PARAMS)
+    assert conn.sent == 1
+    assert connects == []
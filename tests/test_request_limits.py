@@ -0,0 +1,141 @@
+"""Request body size guard and quote/contact payload bounds."""
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from body_limit import MaxBodySizeMiddleware
+from server import app, MAX_MESSAGE_LENGTH, MAX_QUOTE_ITEMS
+
+client = TestClient(app)
+
+QUOTE = {
+    "name": "Jane Doe",
+    "email": "jane@example.com",
+    "phone": "5555555555",
+    "event_type": "wedding",
+    "message": "Looking for tables and chairs for 120 guests.",
+}
+
+
+def _scope(path="/api/quotes", headers=None):
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers or [(b"host", b"testserver"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+
+def _stream(asgi_app, chunks, scope=None):
+    """Call asgi_app with a receive() yielding chunks (more_body=True); return (status, body, chunks read)."""
+    chunks = list(chunks)
+    read = 0
+    sent = []
+
+    async def receive():
+        nonlocal read
+        if read >= len(chunks):
+            return {"type": "http.disconnect"}
+        read += 1
+        return {"type": "http.request", "body": chunks[read - 1], "more_body": read < len(chunks)}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi_app(scope or _scope(), receive, send))
+    status = next(m["status"] for m in sent if m["type"] == "http.response.start")
+    body = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    return status, body, read
+
+
+def test_declared_content_length_over_limit_is_413():
+    response = client.post(
+        "/api/quotes",
+        content=json.dumps({**QUOTE, "message": "A" * 200_000}),
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request body too large"}
+
+
+def test_413_carries_cors_headers():
+    response = client.post(
+        "/api/contact",
+        content=b"x" * 200_000,
+        headers={"content-type": "application/json", "origin": "http://localhost:3000"},
+    )
+    assert response.status_code == 413
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+
+def test_streamed_body_rejected_before_fully_read():
+    chunk = b"A" * 16 * 1024
+    status, body, read = _stream(app, [b'{"message": "'] + [chunk] * 200 + [b'"}'])
+    assert status == 413
+    assert json.loads(body) == {"detail": "Request body too large"}
+    # 64 KiB default cap: stops after ~5 of 202 chunks
+    assert read < 10
+
+
+def test_streamed_body_under_limit_passes_through():
+    received = []
+
+    async def echo(scope, receive, send):
+        while True:
+            message = await receive()
+            received.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    status, body, _ = _stream(MaxBodySizeMiddleware(echo, max_body_bytes=100), [b"a" * 40, b"b" * 40])
+    assert (status, body) == (200, b"ok")
+    assert b"".join(received) == b"a" * 40 + b"b" * 40
+
+
+def test_typed_items_accepted():
+    items = [{"id": "r-1", "name": "Chiavari Chair", "quantity": 120}]
+    response = client.post("/api/quotes", json={**QUOTE, "items": items})
+    assert response.status_code == 200
+
+
+def test_cart_shaped_payload_at_client_caps_accepted():
+    # What CheckoutPage sends for a full cart: 50 lines at the 999 per-line cap of cartService
+    items = [{"id": f"rental-{i}", "name": f"Rental {i}", "quantity": 999} for i in range(MAX_QUOTE_ITEMS)]
+    payload = {**QUOTE, "items": items, "form_elapsed_ms": 45_000}
+    response = client.post("/api/quotes", json=payload)
+    assert response.status_code == 200
+
+
+def test_too_many_items_rejected():
+    items = [{"name": "Chair", "quantity": 1}] * (MAX_QUOTE_ITEMS + 1)
+    assert client.post("/api/quotes", json={**QUOTE, "items": items}).status_code == 422
+
+
+def test_item_quantity_bounds():
+    for quantity in (0, 1001):
+        items = [{"name": "Chair", "quantity": quantity}]
+        assert client.post("/api/quotes", json={**QUOTE, "items": items}).status_code == 422
+
+
+def test_item_requires_name():
+    items = [{"id": "r-1", "quantity": 1}]
+    assert client.post("/api/quotes", json={**QUOTE, "items": items}).status_code == 422
+
+
+def test_message_length_capped():
+    message = "m" * (MAX_MESSAGE_LENGTH + 1)
+    assert client.post("/api/quotes", json={**QUOTE, "message": message}).status_code == 422
+    contact = {"name": "Jane", "email": "jane@example.com", "subject": "Hi", "message": message}
+    assert client.post("/api/contact", json=contact).status_code == 422
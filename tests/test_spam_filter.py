@@ -0,0 +1,174 @@
+"""Spam pre-filter verdicts, quarantine, training and endpoint wiring."""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import email_service
+import server
+import spam_filter
+from spam_filter import check_submission, submission_text, train
+
+HAM = [
+    "Looking for tables chairs and linens for a wedding reception with 120 guests",
+    "Do you rent tents for a backyard birthday party next month",
+    "Interested in arch and floral decor for a baby shower",
+    "Need a PA system and projector for a corporate event",
+]
+SPAM = [
+    "Boost your SEO ranking today visit http://cheap-seo.example best price",
+    "Crypto investment opportunity earn $5000 weekly click www.win.example",
+    "Cheap SEO backlinks boost ranking http://links.example buy now",
+    "Buy followers and likes instantly http://followers.example limited offer",
+]
+
+CONTACT = {"name": "Jane Doe", "email": "jane@example.com", "subject": "Wedding", "message": HAM[0]}
+QUOTE = {
+    "name": "Jane Doe",
+    "email": "jane@example.com",
+    "phone": "5555555555",
+    "event_type": "wedding",
+    "message": HAM[0],
+}
+
+
+def _texts(messages):
+    return [submission_text({"name": "Jane Doe", "message": m}) for m in messages]
+
+
+@pytest.fixture
+def no_model(monkeypatch):
+    monkeypatch.setattr(spam_filter, "_model", None)
+    monkeypatch.setattr(spam_filter, "_model_loaded", True)
+
+
+@pytest.fixture
+def trained_model(monkeypatch):
+    model = train(_texts(HAM + SPAM), [0] * len(HAM) + [1] * len(SPAM), n_buckets=1 << 12)
+    monkeypatch.setattr(spam_filter, "_model", model)
+    monkeypatch.setattr(spam_filter, "_model_loaded", True)
+    return model
+
+
+@pytest.fixture
+def quarantine(tmp_path, monkeypatch):
+    path = tmp_path / "quarantine.jsonl"
+    monkeypatch.setattr(spam_filter, "SPAM_QUARANTINE_PATH", str(path))
+    return path
+
+
+@pytest.fixture
+def email_tasks(monkeypatch):
+    """Record queued email tasks instead of running them."""
+    calls = []
+    monkeypatch.setattr(server, "_send_contact_email_task", lambda *a: calls.append(("contact", a)))
+    monkeypatch.setattr(server, "_send_quote_emails_task", lambda *a: calls.append(("quote", a)))
+    return calls
+
+
+def test_honeypot_is_spam(no_model):
+    verdict = check_submission(CONTACT, honeypot="http://spam.example", elapsed_ms=10_000)
+    assert verdict.is_spam and verdict.reasons == ["honeypot"]
+
+
+def test_too_fast_is_spam(no_model):
+    verdict = check_submission(CONTACT, elapsed_ms=spam_filter.MIN_FILL_MS - 1)
+    assert verdict.is_spam and verdict.reasons == ["too_fast"]
+
+
+def test_missing_elapsed_is_spam(no_model):
+    # The site's forms always send form_elapsed_ms; only direct API posts omit it
+    verdict = check_submission(CONTACT, elapsed_ms=None)
+    assert verdict.is_spam and verdict.reasons == ["no_timing"]
+
+
+def test_human_timing_passes(no_model):
+    assert not check_submission(CONTACT, elapsed_ms=spam_filter.MIN_FILL_MS).is_spam
+
+
+def test_train_separates_ham_from_spam(trained_model):
+    for text in _texts(HAM):
+        assert trained_model.score(text) < 0.5
+    for text in _texts(SPAM):
+        assert trained_model.score(text) >= trained_model.threshold
+
+
+def test_classifier_verdict(trained_model):
+    verdict = check_submission({**CONTACT, "message": SPAM[0]}, elapsed_ms=10_000)
+    assert verdict.is_spam and verdict.reasons == ["classifier"]
+    assert not check_submission(CONTACT, elapsed_ms=10_000).is_spam
+
+
+def test_model_save_load_roundtrip(trained_model, tmp_path):
+    path = str(tmp_path / "model.npz")
+    trained_model.save(path)
+    loaded = spam_filter.SpamModel.load(path)
+    assert loaded.threshold == pytest.approx(trained_model.threshold)
+    text = _texts(SPAM)[0]
+    assert loaded.score(text) == pytest.approx(trained_model.score(text))
+
+
+def test_quarantine_appends_jsonl(quarantine, caplog):
+    verdict = spam_filter.SpamVerdict(True, 1.0, ["honeypot"])
+    with caplog.at_level("WARNING", logger="spam_filter"):
+        spam_filter.quarantine_submission("contact", CONTACT, verdict)
+    # Recoverable from logs alone if the quarantine file is lost
+    (record,) = caplog.records
+    assert record.levelname == "WARNING"
+    assert "contact" in record.getMessage() and "honeypot" in record.getMessage()
+    assert CONTACT["name"] in record.getMessage() and CONTACT["email"] in record.getMessage()
+    spam_filter.quarantine_submission("contact", CONTACT, verdict)
+    rows = [json.loads(line) for line in quarantine.read_text().splitlines()]
+    assert len(rows) == 2
+    assert rows[0]["kind"] == "contact" and rows[0]["reasons"] == ["honeypot"]
+    assert rows[0]["message"] == CONTACT["message"]
+
+
+def test_spam_contact_gets_normal_response_without_email(no_model, quarantine, email_tasks):
+    client = TestClient(server.app)
+    normal = client.post("/api/contact", json={**CONTACT, "form_elapsed_ms": 10_000})
+    spam = client.post("/api/contact", json={**CONTACT, "website": "http://spam.example"})
+
+    assert spam.status_code == 200
+    assert spam.json() == normal.json()
+    assert [kind for kind, _ in email_tasks] == ["contact"]
+    (row,) = [json.loads(line) for line in quarantine.read_text().splitlines()]
+    assert row["reasons"] == ["honeypot"]
+    assert "website" not in row
+
+
+def test_spam_quote_gets_normal_response_without_email(no_model, quarantine, email_tasks):
+    client = TestClient(server.app)
+    normal = client.post("/api/quotes", json={**QUOTE, "form_elapsed_ms": 10_000})
+    spam = client.post("/api/quotes", json={**QUOTE, "form_elapsed_ms": 200})
+
+    assert spam.status_code == 200
+    assert spam.json() == normal.json()
+    assert "form_elapsed_ms" not in spam.json()["data"]
+    assert [kind for kind, _ in email_tasks] == ["quote"]
+    (row,) = [json.loads(line) for line in quarantine.read_text().splitlines()]
+    assert row["kind"] == "quote" and row["reasons"] == ["too_fast"]
+
+
+def test_direct_api_post_without_timing_is_quarantined(no_model, quarantine, email_tasks):
+    response = TestClient(server.app).post("/api/contact", json=CONTACT)
+    assert response.status_code == 200
+    assert email_tasks == []
+    (row,) = [json.loads(line) for line in quarantine.read_text().splitlines()]
+    assert row["reasons"] == ["no_timing"]
+
+
+def test_model_loaded_at_startup(trained_model, tmp_path, monkeypatch):
+    path = str(tmp_path / "model.npz")
+    trained_model.save(path)
+    monkeypatch.setattr(spam_filter, "SPAM_MODEL_PATH", path)
+    # Startup/shutdown hooks reconfigure the email transport; restore it afterwards
+    monkeypatch.setattr(email_service, "_transport", None)
+    monkeypatch.setattr(email_service, "_transport_configured", False)
+    monkeypatch.setattr(spam_filter, "_model", None)
+    monkeypatch.setattr(spam_filter, "_model_loaded", False)
+
+    with TestClient(server.app):
+        assert spam_filter._model_loaded
+        assert spam_filter._model is not None